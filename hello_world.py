@@ -28,7 +28,10 @@ def sample_scrape():
         print(f"Request failed: {e}")
         return
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Only pass a charset the server actually sent (requests defaults text/* to
+    # ISO-8859-1); otherwise BeautifulSoup reads the page's own <meta charset>.
+    declared = "charset=" in resp.headers.get("Content-Type", "").lower()
+    soup = BeautifulSoup(resp.content, "lxml", from_encoding=resp.encoding if declared else None)
     title = soup.title.string.strip() if soup.title and soup.title.string else "No title found"
     print(f"Scraped {url}: title -> {title}")
 
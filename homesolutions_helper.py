@@ -10,20 +10,113 @@ few common HTML patterns so it keeps working even if the layout changes.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import codecs
+import os
 import sys
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
 import json
 import csv
-from urllib.parse import urlparse, parse_qs, quote
+import functools
+from concurrent.futures import ProcessPoolExecutor
+import io
+import itertools
+import multiprocessing
+import re
+from urllib.parse import urljoin, urlparse, parse_qs, quote
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+# selectolax (lexbor bindings) is an optional, faster parser; lxml is used when it
+# isn't installed.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _HAS_SELECTOLAX = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_SELECTOLAX = False
+
+# orjson is an optional, faster JSON encoder; the stdlib json module is the fallback.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAS_ORJSON = False
 
 BASE_URL = "https://homesolutionshelper.com"
 
+# Selectors are compiled once at import and reused by every parse_articles() call.
+_HEADING_TAGS = ("h1", "h2", "h3")
+_HEADING_XPATH = etree.XPath("|".join(f".//{tag}" for tag in _HEADING_TAGS))
+_ARTICLE_XPATH = etree.XPath(".//article")
+# blank src attributes are skipped: urljoin would turn them into the page URL
+_IMG_SRC_XPATH = etree.XPath(".//img/@src[normalize-space()]")
+# the element itself plus up to 6 ancestors are searched for images near a heading
+_IMG_SEARCH_LEVELS = 7
+_IMG_CONTAINER_XPATH = etree.XPath(
+    f"ancestor-or-self::*[position() <= {_IMG_SEARCH_LEVELS}][.//img[normalize-space(@src)]][1]"
+)
+_FALLBACK_SEL = CSSSelector("h2 a, h3 a, h2, h3")
+_NON_EMPTY_IMG_CSS = 'img[src]:not([src=""])'
+_WS_RE = re.compile(r"\s+")
+_XML_DECL_RE = re.compile(r"\s*<\?xml[^>]*\?>")
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+_HEADER_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+# lxml hands the str chunks of a text stream to libxml2 as UTF-8, which would
+# otherwise assume latin-1 unless the page declares a charset
+_UTF8_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+# Accept-Encoding is deliberately left to the clients: requests/urllib3 and aiohttp
+# each advertise gzip/deflate plus br (and zstd) when a matching decoder is installed.
+_HEADERS = {
+    "User-Agent": "scraping-scripts/1.0 (+https://homesolutionshelper.com/robots.txt)",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# One pooled session for the whole process so repeated fetches against the same
+# host reuse the TCP/TLS connection instead of handshaking every time.
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+atexit.register(_SESSION.close)
+
+# url -> (etag, last_modified, body) from the last successful fetch, persisted so
+# repeated runs can send conditional requests and get a cheap 304 back.
+_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "scraping_scripts",
+    "http_cache.json",
+)
+_CACHE: Optional[dict[str, tuple[str, str, str]]] = None
+
+
+def _load_cache() -> dict[str, tuple[str, str, str]]:
+    global _CACHE
+    if _CACHE is None:
+        try:
+            with open(_CACHE_PATH, encoding="utf-8") as fh:
+                _CACHE = {url: tuple(entry) for url, entry in json.load(fh).items()}
+        except (OSError, ValueError):
+            _CACHE = {}
+    return _CACHE
+
+
+def _save_cache() -> None:
+    # the cache is an optimisation only, so never fail a scrape because it can't be written
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "w", encoding="utf-8") as fh:
+            json.dump(_CACHE, fh)
+    except OSError:
+        pass
+
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Simple representation of a headline on Home Solutions Helper."""
 
@@ -36,157 +129,484 @@ class Article:
 def fetch_html(url: str, timeout: int = 15) -> str:
     """Fetch a page and return its HTML text.
 
+    The body is decoded with :func:`_decode_html` (``Content-Type`` charset,
+    then ``<meta charset>``, then UTF-8) rather than ``response.text``, so
+    requests never runs charset detection over the page.
+
+    Sends ``If-None-Match``/``If-Modified-Since`` when a previous response for
+    ``url`` was cached, and returns the cached body on ``304 Not Modified``.
+
+    Raises:
+        requests.HTTPError: if the response returns an error status code.
+    """
+
+    cache = _load_cache()
+    cached = cache.get(url)
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = _SESSION.get(url, timeout=timeout, headers=headers)
+    if response.status_code == 304 and cached:
+        return cached[2]
+    response.raise_for_status()
+
+    text = _decode_html(response.content, _header_charset(response.headers.get("Content-Type")))
+    etag = response.headers.get("ETag", "")
+    last_modified = response.headers.get("Last-Modified", "")
+    if etag or last_modified:
+        cache[url] = (etag, last_modified, text)
+        _save_cache()
+    return text
+
+
+def fetch_stream(url: str, timeout: int = 15) -> IO[str]:
+    """Open a page for streaming and return a text stream over its body.
+
+    The body is decompressed and decoded on the fly (charset resolved like
+    :func:`_decode_html`) and can be passed straight to :func:`parse_articles`.
+    With the lxml backend the tree is then built while the response is still
+    arriving instead of holding the full page in memory first; selectolax has
+    no incremental API, so it reads the whole stream anyway.
+
+    This is an opt-in API for library callers: :func:`scrape` and the CLI keep
+    using :func:`fetch_html`, because its conditional-request cache needs the
+    whole body to store it.
+
     Raises:
         requests.HTTPError: if the response returns an error status code.
     """
 
-    headers = {
-        "User-Agent": "scraping-scripts/1.0 (+https://homesolutionshelper.com/robots.txt)",
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-    response = requests.get(url, timeout=timeout, headers=headers)
+    response = _SESSION.get(url, timeout=timeout, stream=True)
     response.raise_for_status()
-    return response.text
+    response.raw.decode_content = True
+    # urllib3 closes an exhausted response by default, which breaks io wrappers
+    response.raw.auto_close = False
+    return _text_stream(response.raw, _header_charset(response.headers.get("Content-Type")))
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Raw binary stream that replays ``prefix`` before reading on from ``stream``."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        super().__init__()
+        self._prefix = prefix
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._prefix:
+            n = min(len(buffer), len(self._prefix))
+            buffer[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._stream.read(len(buffer)) or b""
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _text_stream(stream: IO[bytes], declared: Optional[str] = None) -> IO[str]:
+    # read until the first 1024 bytes (or EOF) are in hand, since a single read may
+    # stop short of <meta charset>, then replay them ahead of the rest of the body
+    prefix = b""
+    while len(prefix) < 1024:
+        chunk = stream.read(1024 - len(prefix))
+        if not chunk:
+            break
+        prefix += chunk
+    charset = _resolve_charset(prefix, declared)
+    buffered = io.BufferedReader(_PrefixedStream(prefix, stream))
+    return io.TextIOWrapper(buffered, encoding=charset, errors="replace")
 
 
 def _clean_text(text: str) -> str:
-    return " ".join(text.split())
+    return _WS_RE.sub(" ", text).strip()
 
 
-def _article_from_element(element) -> Optional[Article]:
-    heading = element.find(["h1", "h2", "h3"])
-    if heading is None:
+def _article_from_element(element, base_url: str) -> Optional[Article]:
+    headings = _HEADING_XPATH(element)
+    if not headings:
         return None
+    heading = headings[0]
 
-    link_tag = heading.find("a") or heading
-    title_text = link_tag.get_text(strip=True)
+    # lxml elements are falsy when they have no children, so compare with None
+    link_tag = heading.find(".//a")
+    if link_tag is None:
+        link_tag = heading
+    title_text = _clean_text(link_tag.text_content())
     if not title_text:
         return None
 
-    href = link_tag.get("href") or BASE_URL
-    if href.startswith("/"):
-        href = BASE_URL + href
+    href = _absolutize(link_tag.get("href") or base_url, base_url)
 
-    summary_tag = element.find("p")
-    summary_text = _clean_text(summary_tag.get_text()) if summary_tag else None
+    summary_tag = element.find(".//p")
+    summary_text = _clean_text(summary_tag.text_content()) if summary_tag is not None else None
 
     # extract images from the article container if present
     images: List[str] = []
-    for img in element.find_all("img", src=True):
-        src = img.get("src")
+    for src in _IMG_SRC_XPATH(element):
         if src:
-            images.append(_normalize_src(src))
+            images.append(_normalize_src(src, base_url))
+
+    return Article(title=title_text, url=href, summary=summary_text, images=images)
+
+
+def _absolutize(href: str, base_url: str) -> str:
+    """Resolve a relative or protocol-relative URL against the page it came from."""
+
+    return urljoin(base_url, href)
+
+
+def _normalize_src(src: str, base_url: str) -> str:
+    return _absolutize(src.strip(), base_url)
+
+
+def _node_img_srcs(node) -> List[str]:
+    # blank src attributes are skipped: urljoin would turn them into the page URL
+    return [src for img in node.css(_NON_EMPTY_IMG_CSS) if (src := img.attributes.get("src") or "").strip()]
+
+
+def _article_from_node(node, base_url: str) -> Optional[Article]:
+    """selectolax counterpart of :func:`_article_from_element`."""
+
+    heading = node.css_first("h1, h2, h3")
+    if heading is None:
+        return None
+
+    link_tag = heading.css_first("a") or heading
+    title_text = _clean_text(link_tag.text())
+    if not title_text:
+        return None
+
+    href = _absolutize(link_tag.attributes.get("href") or base_url, base_url)
+
+    summary_tag = node.css_first("p")
+    summary_text = _clean_text(summary_tag.text()) if summary_tag is not None else None
+
+    images: List[str] = []
+    for src in _node_img_srcs(node):
+        images.append(_normalize_src(src, base_url))
 
     return Article(title=title_text, url=href, summary=summary_text, images=images)
 
 
-def _normalize_src(src: str) -> str:
-    src = src.strip()
-    if src.startswith("//"):
-        return "https:" + src
-    if src.startswith("/"):
-        return BASE_URL + src
-    return src
+def _iter_articles_selectolax(html: str, base_url: str) -> Iterator[Article]:
+    """Fast path for :func:`_iter_articles`; mirrors the lxml implementation."""
+
+    tree = LexborHTMLParser(html)
+
+    seen_keys: set[str] = set()
+
+    for container in tree.css("article"):
+        maybe_article = _article_from_node(container, base_url)
+        if maybe_article:
+            key = maybe_article.url if maybe_article.url != base_url else maybe_article.title
+            if key not in seen_keys:
+                seen_keys.add(key)
+                yield maybe_article
+
+    if seen_keys:
+        return
+
+    for heading in tree.css("h2 a, h3 a, h2, h3"):
+        search_element = None
+        if heading.tag == "a":
+            title = _clean_text(heading.text())
+            href = heading.attributes.get("href") or base_url
+            search_element = heading.parent
+        else:
+            anchor = heading.css_first("a")
+            if anchor is not None and anchor.attributes.get("href"):
+                title = _clean_text(anchor.text()) or _clean_text(heading.text())
+                href = anchor.attributes.get("href")
+                search_element = anchor.parent
+            else:
+                title = _clean_text(heading.text())
+                href = base_url
+                search_element = heading
 
+        if not title:
+            continue
+
+        href = _absolutize(href, base_url)
 
-def parse_articles(html: str) -> List[Article]:
-    """Parse article headlines from the Home Solutions Helper homepage HTML."""
+        dedupe_key = href if href != base_url else title
+        if dedupe_key in seen_keys:
+            continue
 
-    soup = BeautifulSoup(html, "html.parser")
+        images: List[str] = []
+        # climb to the nearest container (at most 6 levels up) that holds any image
+        # and only enumerate that one, instead of listing images at every level
+        container = search_element
+        for _ in range(_IMG_SEARCH_LEVELS):
+            if container is None:
+                break
+            if container.css_first(_NON_EMPTY_IMG_CSS) is not None:
+                images = [_normalize_src(src, base_url) for src in _node_img_srcs(container)]
+                if images:
+                    break
+            container = container.parent
+
+        seen_keys.add(dedupe_key)
+        yield Article(title=title, url=href, images=images)
 
-    articles: List[Article] = []
-    # Use a dedupe set that prefers per-item href when available; when href == BASE_URL
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    # requests' response.encoding defaults text/* to ISO-8859-1, so read the header directly
+    match = _HEADER_CHARSET_RE.search(content_type or "")
+    return match.group(1) if match else None
+
+
+def _resolve_charset(html: bytes, declared: Optional[str] = None) -> str:
+    """Pick a page's charset: the HTTP header's, then ``<meta charset>``, then UTF-8."""
+
+    # <meta charset> must appear in the first 1024 bytes, so only that is scanned
+    meta = _META_CHARSET_RE.search(html, 0, 1024)
+    for candidate in (declared, meta.group(1).decode("ascii") if meta else None):
+        if candidate:
+            try:
+                return codecs.lookup(candidate).name
+            except LookupError:
+                pass  # unknown charset name; try the next source
+    return "utf-8"
+
+
+def _decode_html(html: bytes, declared: Optional[str] = None) -> str:
+    return html.decode(_resolve_charset(html, declared), "replace")
+
+
+def _iter_articles(html: Union[str, bytes, IO[str], IO[bytes]], base_url: str = BASE_URL) -> Iterator[Article]:
+    """Lazily yield articles so callers that only need the first few can stop early.
+
+    ``html`` may be the page text, the raw page bytes, or a file-like object
+    such as the one returned by :func:`fetch_stream`. Bytes, and binary
+    streams, are decoded like :func:`_decode_html`. Uses selectolax when it is
+    installed and lxml otherwise; both produce the same articles.
+    """
+
+    if isinstance(html, io.StringIO):
+        html = html.getvalue()
+    elif hasattr(html, "read"):
+        if not isinstance(html, io.TextIOBase):
+            html = _text_stream(html)
+        if _HAS_SELECTOLAX:
+            html = html.read()
+        else:
+            # lxml reads the already-decoded stream in chunks
+            doc = lxml_html.parse(html, parser=_UTF8_PARSER).getroot()
+            if doc is None:
+                return iter(())
+            return _iter_articles_lxml(doc, base_url)
+
+    if isinstance(html, bytes):
+        html = _decode_html(html)
+    if not html or not html.strip():
+        return iter(())
+
+    if _HAS_SELECTOLAX:
+        return _iter_articles_selectolax(html, base_url)
+    # lxml refuses str input that still carries an XML encoding declaration
+    decl = _XML_DECL_RE.match(html)
+    if decl:
+        html = html[decl.end():]
+    try:
+        doc = lxml_html.fromstring(html)
+    except etree.ParserError:
+        # nothing but comments/whitespace: no document, hence no articles
+        return iter(())
+    return _iter_articles_lxml(doc, base_url)
+
+
+def parse_articles(html: Union[str, bytes, IO[str], IO[bytes]], base_url: str = BASE_URL) -> List[Article]:
+    """Parse article headlines from the Home Solutions Helper homepage HTML.
+
+    Relative links and image sources are resolved against ``base_url``, which
+    should be the URL the page was fetched from. See :func:`_iter_articles`
+    for the accepted inputs.
+    """
+
+    return list(_iter_articles(html, base_url))
+
+
+def _iter_articles_lxml(doc, base_url: str) -> Iterator[Article]:
+    # Use a dedupe set that prefers per-item href when available; when href == base_url
     # (fallback), dedupe by title so we keep multiple distinct listings even without links.
     seen_keys: set[str] = set()
 
     # First try semantic <article> elements
-    for container in soup.find_all("article"):
-        maybe_article = _article_from_element(container)
+    for container in _ARTICLE_XPATH(doc):
+        maybe_article = _article_from_element(container, base_url)
         if maybe_article:
-            key = maybe_article.url if maybe_article.url != BASE_URL else maybe_article.title
+            key = maybe_article.url if maybe_article.url != base_url else maybe_article.title
             if key not in seen_keys:
-                articles.append(maybe_article)
                 seen_keys.add(key)
+                yield maybe_article
+
+    # The heading scan below re-walks the whole document, so only run it when the
+    # page has no usable <article> markup (seen_keys is empty iff nothing was yielded).
+    if seen_keys:
+        return
 
     # Fallback: find headings with or without anchors (covers sites that don't use <article>)
     # Use a combined selector so we catch both `h2 a` and plain `h2`/`h3` elements.
-    for heading in soup.select("h2 a, h3 a, h2, h3"):
+    for heading in _FALLBACK_SEL(doc):
         # determine title, href and an element to search for images
         search_element = None
-        if heading.name == "a":
-            title = heading.get_text(strip=True)
-            href = heading.get("href") or BASE_URL
-            search_element = heading.parent
+        if heading.tag == "a":
+            title = _clean_text(heading.text_content())
+            href = heading.get("href") or base_url
+            search_element = heading.getparent()
         else:
-            anchor = heading.find("a")
-            if anchor and anchor.get("href"):
-                title = anchor.get_text(strip=True) or heading.get_text(strip=True)
+            anchor = heading.find(".//a")
+            if anchor is not None and anchor.get("href"):
+                title = _clean_text(anchor.text_content()) or _clean_text(heading.text_content())
                 href = anchor.get("href")
-                search_element = anchor.parent
+                search_element = anchor.getparent()
             else:
-                title = heading.get_text(strip=True)
-                href = BASE_URL
+                title = _clean_text(heading.text_content())
+                href = base_url
                 search_element = heading
 
         if not title:
             continue
 
-        if href.startswith("/"):
-            href = BASE_URL + href
+        href = _absolutize(href, base_url)
 
         # choose dedupe key: prefer href when it's a real per-item link, otherwise use title
-        dedupe_key = href if href != BASE_URL else title
+        dedupe_key = href if href != base_url else title
         if dedupe_key in seen_keys:
             continue
 
-        # find images near the heading (inside element or in ancestors)
+        # find images near the heading: the closest element (itself or up to 6
+        # ancestors) that contains any image, located with a single XPath query
         images: List[str] = []
         if search_element is not None:
-            for img in search_element.find_all("img", src=True):
-                images.append(_normalize_src(img.get("src")))
-            anc = search_element.parent
-            steps = 0
-            while not images and anc is not None and steps < 6:
-                for img in anc.find_all("img", src=True):
-                    images.append(_normalize_src(img.get("src")))
-                anc = anc.parent
-                steps += 1
-
-        articles.append(Article(title=title, url=href, images=images))
-        seen_keys.add(dedupe_key)
+            for container in _IMG_CONTAINER_XPATH(search_element):
+                images = [_normalize_src(src, base_url) for src in _IMG_SRC_XPATH(container)]
 
-    return articles
+        seen_keys.add(dedupe_key)
+        yield Article(title=title, url=href, images=images)
 
 
 def scrape(limit: Optional[int] = None) -> List[Article]:
     """Scrape the Home Solutions Helper homepage for headlines."""
 
     html = fetch_html(BASE_URL)
-    articles = parse_articles(html)
-    if limit is not None:
-        articles = articles[:limit]
-    return articles
+    return _take(_iter_articles(html), limit)
+
+
+def _take(articles: Iterator[Article], limit: Optional[int]) -> List[Article]:
+    """Return the first ``limit`` articles, with the same semantics as ``list[:limit]``."""
+
+    if limit is not None and limit < 0:
+        # a negative limit drops articles from the end, so the page must be parsed fully
+        return list(articles)[:limit]
+    # islice(..., None) takes everything, so no special case for a missing limit
+    return list(itertools.islice(articles, limit))
+
+
+# scrape_many only parses in a process pool from this many pages up
+_POOL_MIN_PAGES = 16
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+async def _fetch(session, url: str) -> Tuple[str, str]:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        # decode like fetch_html; response.text() would run charset detection
+        html = _decode_html(await response.read(), response.charset)
+        # return the final URL so relative links resolve correctly after redirects
+        return str(response.url), html
+
+
+async def scrape_many(urls: Iterable[str], limit: Optional[int] = None, timeout: int = 15) -> List[Article]:
+    """Fetch several pages concurrently and return the headlines found on each.
+
+    Pages may be on any site: relative links are resolved against each page's
+    own URL. ``limit`` applies per page, like :func:`scrape`. Pages that fail to download
+    are reported on stderr and skipped so one bad URL does not sink the batch.
+    Large batches are parsed in a process pool so parsing uses every core; its
+    workers are started with forkserver/spawn, so scripts calling this must
+    guard their entry point with ``if __name__ == "__main__":``.
+    """
+
+    import aiohttp
+
+    urls = list(urls)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(headers=_HEADERS, timeout=client_timeout) as session:
+        results = await asyncio.gather(*[_fetch(session, url) for url in urls], return_exceptions=True)
+
+    pages: List[Tuple[str, str]] = []
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            print(f"Scrape failed for {url}: {result}", file=sys.stderr)
+            continue
+        pages.append(result)
+
+    # parsing is blocking CPU work, so keep it off the event loop
+    return await asyncio.to_thread(_parse_pages, pages, limit)
+
+
+def _parse_pages(pages: List[Tuple[str, str]], limit: Optional[int]) -> List[Article]:
+    # pages are (url, html) pairs
+    parse = functools.partial(_parse_page, limit=limit)
+    urls = [url for url, _ in pages]
+    htmls = [html for _, html in pages]
+    if len(pages) < _POOL_MIN_PAGES:
+        # not worth the pool's startup cost
+        parsed = map(parse, htmls, urls)
+    else:
+        # this runs in a worker thread, and forking a multi-threaded process can
+        # deadlock, so start the workers from a clean forkserver/spawn process
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_POOL_CONTEXT) as pool:
+            parsed = list(pool.map(parse, htmls, urls, chunksize=4))
+    return list(itertools.chain.from_iterable(parsed))
+
+
+def _parse_page(html: str, base_url: str, limit: Optional[int]) -> List[Article]:
+    # module-level so ProcessPoolExecutor can pickle it
+    return _take(_iter_articles(html, base_url), limit)
+
+
+def _read_urls(path: str) -> List[str]:
+    # one URL per line; blank lines and '#' comments are ignored
+    with open(path, encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.lstrip().startswith("#")]
 
 
 def _format_articles(articles: Iterable[Article]) -> str:
-    lines = []
+    buf = io.StringIO()
     for idx, article in enumerate(articles, start=1):
-        lines.append(f"{idx}. {article.title}")
-        lines.append(f"   link: {article.url}")
+        buf.write(f"{idx}. {article.title}\n   link: {article.url}\n")
         if article.summary:
-            lines.append(f"   summary: {article.summary}")
-        if getattr(article, "images", None):
-            for i, img in enumerate(article.images, start=1):
-                lines.append(f"   image_{i}: {img}")
-    return "\n".join(lines)
+            buf.write(f"   summary: {article.summary}\n")
+        for i, img in enumerate(article.images, start=1):
+            buf.write(f"   image_{i}: {img}\n")
+    return buf.getvalue().rstrip("\n")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_url(url: str):
+    # image URLs repeat across articles and runs, so memoise the parse
+    return urlparse(url)
 
 
 def _article_to_dict(a: Article, dropbox_base: Optional[str] = None) -> dict:
-    images = list(a.images)
+    images = a.images
     if dropbox_base and images:
+        base = dropbox_base.rstrip("/") + "/"
         mapped = []
         for src in images:
-            parsed = urlparse(src)
+            parsed = _parse_url(src)
             qs = parse_qs(parsed.query)
             filename = None
             if "file" in qs and qs["file"]:
@@ -194,26 +614,27 @@ def _article_to_dict(a: Article, dropbox_base: Optional[str] = None) -> dict:
             else:
                 filename = parsed.path.rsplit("/", 1)[-1]
             if filename:
-                mapped.append(dropbox_base.rstrip("/") + "/" + quote(filename))
+                mapped.append(base + quote(filename))
         if mapped:
             images = mapped
     return {"title": a.title, "url": a.url, "summary": a.summary, "images": images}
 
 
+def _row_for(a: Article, max_images: int, dropbox_base: Optional[str]) -> tuple:
+    d = _article_to_dict(a, dropbox_base=dropbox_base)
+    images = d["images"]
+    # fill image columns, pad with empty strings
+    return (d["title"] or "", d["url"] or "", d["summary"] or "", *images, *[""] * (max_images - len(images)))
+
+
 def _write_csv(articles: List[Article], dropbox_base: Optional[str], output: Optional[str]) -> None:
     # CSV columns: title,url,summary,image_1,...,image_N
-    dicts = [_article_to_dict(a, dropbox_base=dropbox_base) for a in articles]
-    max_images = max((len(d.get("images") or []) for d in dicts), default=0)
+    # Dropbox mapping never adds images, so the raw counts bound the column count
+    # and rows can be built one at a time while writing.
+    max_images = max((len(a.images) for a in articles), default=0)
 
     fieldnames = ["title", "url", "summary"] + [f"image_{i+1}" for i in range(max_images)]
-
-    rows = []
-    for d in dicts:
-        imgs = d.get("images") or []
-        row = [d.get("title") or "", d.get("url") or "", d.get("summary") or ""]
-        # fill image columns, pad with empty strings
-        row += imgs + [""] * (max_images - len(imgs))
-        rows.append(row)
+    rows = (_row_for(a, max_images, dropbox_base) for a in articles)
 
     if output:
         with open(output, "w", encoding="utf-8", newline="") as fh:
@@ -227,6 +648,14 @@ def _write_csv(articles: List[Article], dropbox_base: Optional[str], output: Opt
         writer.writerows(rows)
 
 
+def _json_bytes(data) -> bytes:
+    """Encode ``data`` as compact UTF-8 JSON for ``--output`` files."""
+
+    if _HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Scrape https://homesolutionshelper.com for the latest headlines.")
@@ -239,48 +668,39 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--json", action="store_true", help="Output results as JSON")
     parser.add_argument("--csv", action="store_true", help="Output results as CSV")
     parser.add_argument("--dropbox-base", type=str, help="Base Dropbox URL to map image filenames (optional)")
-    parser.add_argument("--output", type=str, help="Write JSON output to a file")
+    parser.add_argument("--output", type=str, help="Write compact JSON output to a file")
     parser.add_argument("--csv-output", type=str, help="Write CSV output to a file")
+    parser.add_argument(
+        "--urls",
+        type=str,
+        help="File with one URL per line to scrape concurrently instead of the homepage",
+    )
     args = parser.parse_args(argv)
 
     try:
-        articles = scrape(limit=args.limit)
+        if args.urls:
+            articles = asyncio.run(scrape_many(_read_urls(args.urls), limit=args.limit))
+        else:
+            articles = scrape(limit=args.limit)
     except Exception as exc:  # pragma: no cover - used for CLI only
         print(f"Scrape failed: {exc}")
         return 1
 
     if not articles:
-        print("No articles found on the homepage.")
+        print("No articles found on the listed pages." if args.urls else "No articles found on the homepage.")
         return 0
 
     if args.json:
         # convert articles to serializable dicts, optionally mapping images to Dropbox
-        def article_to_dict(a: Article) -> dict:
-            images = list(a.images)
-            if args.dropbox_base and images:
-                mapped = []
-                for src in images:
-                    parsed = urlparse(src)
-                    qs = parse_qs(parsed.query)
-                    filename = None
-                    if "file" in qs and qs["file"]:
-                        filename = qs["file"][0]
-                    else:
-                        filename = parsed.path.rsplit("/", 1)[-1]
-                    if filename:
-                        mapped.append(args.dropbox_base.rstrip("/") + "/" + quote(filename))
-                if mapped:
-                    images = mapped
-            return {"title": a.title, "url": a.url, "summary": a.summary, "images": images}
-
-        data = [article_to_dict(a) for a in articles]
-        out = json.dumps(data, indent=2)
+        data = [_article_to_dict(a, dropbox_base=args.dropbox_base) for a in articles]
         if args.output:
-            with open(args.output, "w", encoding="utf-8") as fh:
-                fh.write(out)
+            # files are for downstream tools, so write compact bytes directly
+            with open(args.output, "wb") as fh:
+                fh.write(_json_bytes(data))
             print(f"Wrote JSON to {args.output}")
         else:
-            print(out)
+            # stdout keeps the ASCII-escaped, indented format so any console encoding works
+            print(json.dumps(data, indent=2))
     elif args.csv:
         _write_csv(articles, dropbox_base=args.dropbox_base, output=args.csv_output)
     else: